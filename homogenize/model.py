@@ -1,7 +1,338 @@
 
+import functools
 import math
 import numpy as np
 
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+@functools.lru_cache(maxsize=4096)
+def _tau(t, kappa):
+    return (1 - math.exp(-kappa * t)) / kappa
+
+
+@functools.lru_cache(maxsize=4096)
+def _a0(t, kappa, theta_bar, ss_bar):
+    tau_ = _tau(t, kappa)
+    return (theta_bar - ss_bar / (2 * kappa ** 2)) * (tau_ - t) - (ss_bar * tau_ ** 2) / (4 * kappa)
+
+
+@functools.lru_cache(maxsize=4096)
+def _u0(t, x, kappa, theta_bar, ss_bar):
+    return math.exp(_a0(t, kappa, theta_bar, ss_bar) - _tau(t, kappa) * x)
+
+
+def _first_order_factor(E1, cg, cg1, cg3):
+    """ The factor cg*(1-E1) + cg3*(1-E1)**2/(2*cg1**2) shared by v1_antisymmetric
+        (which squares it) and v2_antisymmetric, with E1 = exp(-cg1*t).
+    """
+    A = 1 - E1
+    return cg * A + cg3 * A * A / (2 * cg1 * cg1)
+
+
+def _sym_numerator(t, E1, E2, E3, E4, cg, cg1, cg3):
+    """ The bracketed polynomial common to v1_symmetric and v2_antisymmetric,
+        before division by 48*cg1**5, with Ek = exp(-k*cg1*t).
+    """
+    k2 = cg1 * cg1
+    k3 = k2 * cg1
+    k4 = k2 * k2
+    k5 = k4 * cg1
+    cg_sq  = cg * cg
+    cg3_sq = cg3 * cg3
+    return ((-24 * cg_sq * k4 - 72 * cg * k2 * cg3 - 36 * cg3_sq) * E2
+            + (96 * cg_sq * k4 + 144 * cg * k2 * cg3 + 48 * cg3_sq) * E1
+            + 16 * cg3 * (cg * k2 + cg3) * E3
+            + 48 * cg_sq * k5 * t - 72 * cg_sq * k4
+            + 48 * cg * k3 * cg3 * t - 88 * cg * k2 * cg3
+            + 12 * cg1 * cg3_sq * t - 3 * cg3_sq * E4 - 25 * cg3_sq)
+
+
+def _v1_symmetric_core(t, E1, cg, cg1, cg3):
+    E2 = E1 * E1
+    E3 = E2 * E1
+    E4 = E2 * E2
+    return _sym_numerator(t, E1, E2, E3, E4, cg, cg1, cg3) / (cg1 ** 5 * 48)
+
+
+@functools.lru_cache(maxsize=4096)
+def _v1_symmetric(t, cg, cg1, cg3):
+    return _v1_symmetric_core(t, math.exp(-cg1 * t), cg, cg1, cg3)
+
+
+def _v1_antisymmetric_core(E1, cg, cg1, cg3):
+    B = _first_order_factor(E1, cg, cg1, cg3)
+    return B * B
+
+
+@functools.lru_cache(maxsize=4096)
+def _v1_antisymmetric(t, cg, cg1, cg3):
+    return _v1_antisymmetric_core(math.exp(-cg1 * t), cg, cg1, cg3)
+
+
+def _v2_antisymmetric_core(t, E1, cg, cg1, cg3):
+    E2 = E1 * E1
+    E3 = E2 * E1
+    E4 = E2 * E2
+    k2 = cg1 * cg1
+    k4 = k2 * k2
+    k5 = k4 * cg1
+    cg_sq  = cg * cg
+    cg3_sq = cg3 * cg3
+    derivative = (-2 * (-24 * cg_sq * k4 - 72 * cg * k2 * cg3 - 36 * cg3_sq) * cg1 * E2
+                  - (96 * cg_sq * k4 + 144 * cg * k2 * cg3 + 48 * cg3_sq) * cg1 * E1
+                  - 48 * cg3 * (cg * k2 + cg3) * cg1 * E3
+                  + 48 * cg_sq * k5 + 48 * cg * k2 * cg1 * cg3
+                  + 12 * cg1 * cg3_sq + 12 * cg3_sq * cg1 * E4)
+    numerator = _sym_numerator(t, E1, E2, E3, E4, cg, cg1, cg3)
+    return (-derivative + _first_order_factor(E1, cg, cg1, cg3) * numerator) / (k5 * 48)
+
+
+@functools.lru_cache(maxsize=4096)
+def _v2_antisymmetric(t, cg, cg1, cg3):
+    return _v2_antisymmetric_core(t, math.exp(-cg1 * t), cg, cg1, cg3)
+
+
+def _v2_symmetric_core(t, E1, cg, cg1, cg3):
+    E2 = E1 * E1
+    E3 = E2 * E1
+    E4 = E2 * E2
+    E5 = E4 * E1
+    E6 = E4 * E2
+    E7 = E4 * E3
+    E8 = E4 * E4
+    ik1 = 1 / cg1
+    ik2 = ik1 * ik1
+    ik3 = ik2 * ik1
+    ik4 = ik2 * ik2
+    ik5 = ik4 * ik1
+    ik6 = ik4 * ik2
+    ik7 = ik4 * ik3
+    ik8 = ik4 * ik4
+    ik9 = ik8 * ik1
+    ik10 = ik8 * ik2
+    cg_sq = cg * cg
+    cg_cu = cg_sq * cg
+    cg_4 = cg_sq * cg_sq
+    cg3_sq = cg3 * cg3
+    cg3_cu = cg3_sq * cg3
+    cg3_4 = cg3_sq * cg3_sq
+    t_sq = t * t
+    terms = [25.0 / 8.0 * ik3 * cg_sq * cg3, 137.0 / 80.0 * ik5 * cg * cg3_sq,
+             9.0 / 2.0 * ik3 * E2 * cg_sq * cg3 - 6.0 * ik3 * E1 * cg_sq * cg3 - 2.0 * ik3 * cg3 * E3 * cg_sq
+             - 3.0 / 2.0 * ik2 * cg_sq * cg3 * t - 3.0 / 4.0 * ik4 * cg * cg3_sq * t,
+             3.0 / 8.0 * ik3 * cg_sq * E4 * cg3,
+             15.0 / 4.0 * ik5 * cg * E2 * cg3_sq - 15.0 / 4.0 * ik5 * cg * E1 * cg3_sq
+             - 5.0 / 2.0 * ik5 * cg * cg3_sq * E3,
+             15.0 / 16.0 * ik5 * cg * cg3_sq * E4 - 3.0 / 20.0 * ik5 * cg * E5 * cg3_sq
+             - 47.0 / 48.0 * ik7 * cg * cg3_cu * t - 131.0 / 48.0 * ik5 * cg_sq * cg3_sq * t
+             - 10.0 / 3.0 * ik3 * cg_cu * cg3 * t,
+             59.0 / 288.0 * ik8 * cg * cg3_cu * E6 - 15.0 / 16.0 * ik8 * cg * cg3_cu * E5,
+             165.0 / 32.0 * ik8 * cg * cg3_cu * E2 - 163.0 / 48.0 * ik8 * cg * cg3_cu * E1
+             - ik8 * cg * cg3_cu * E7 / 48.0,
+             247.0 / 96.0 * ik8 * cg * cg3_cu * E4 - 653.0 / 144.0 * ik8 * cg * cg3_cu * E3,
+             ik6 * cg * cg3_cu * t_sq / 4.0,
+             1021.0 / 96.0 * ik6 * cg_sq * cg3_sq * E2 - 193.0 / 24.0 * ik6 * cg_sq * cg3_sq * E1,
+             25.0 / 288.0 * ik6 * cg_sq * cg3_sq * E6 - 19.0 / 24.0 * ik6 * cg_sq * cg3_sq * E5,
+             313.0 / 96.0 * ik6 * cg_sq * cg3_sq * E4 - 137.0 / 18.0 * ik6 * cg_sq * cg3_sq * E3,
+             3.0 / 4.0 * ik4 * cg_sq * cg3_sq * t_sq - 49.0 / 6.0 * ik4 * cg_cu * cg3 * E1
+             - ik4 * cg_cu * cg3 * E5 / 6.0,
+             17.0 / 12.0 * ik4 * cg_cu * cg3 * E4 - 5.0 * ik4 * cg_cu * cg3 * E3,
+             55.0 / 6.0 * ik4 * cg_cu * cg3 * E2,
+             ik2 * cg_cu * cg3 * t_sq - 19.0 / 8.0 * E2 * ik5 * cg_sq * cg3_sq * t,
+             7.0 / 4.0 * E1 * ik7 * cg * cg3_cu * t,
+             2.0 / 3.0 * E3 * ik5 * cg_sq * cg3_sq * t,
+             E3 * ik3 * cg_cu * cg3 * t / 3.0,
+             9.0 / 2.0 * E1 * ik5 * cg_sq * cg3_sq * t - 2.0 * E2 * ik3 * cg_cu * cg3 * t,
+             cg_4 * t_sq / 2.0 - cg_cu * t,
+             3.0 / 2.0 * ik1 * E2 * cg_cu - 3.0 * ik1 * E1 * cg_cu - ik1 * cg_cu * E3 / 3.0,
+             15.0 / 16.0 * ik7 * cg3_cu * E2 - 3.0 / 4.0 * ik7 * cg3_cu * E1
+             - 5.0 / 6.0 * ik7 * cg3_cu * E3 - ik6 * cg3_cu * t / 8.0,
+             15.0 / 32.0 * ik7 * cg3_cu * E4 - 3.0 / 20.0 * ik7 * cg3_cu * E5,
+             ik7 * cg3_cu * E6 / 48.0 - 25.0 / 192.0 * ik9 * cg3_4 * t - 3.0 / 2.0 * ik1 * cg_4 * t,
+             ik10 * cg3_4 * E8 / 512.0 - ik10 * cg3_4 * E7 / 48.0,
+             59.0 / 576.0 * ik10 * cg3_4 * E6 - 5.0 / 16.0 * ik10 * cg3_4 * E5,
+             497.0 / 768.0 * ik10 * cg3_4 * E4 - 133.0 / 144.0 * ik10 * cg3_4 * E3,
+             57.0 / 64.0 * ik10 * cg3_4 * E2 - 25.0 / 48.0 * ik10 * cg3_4 * E1,
+             ik8 * cg3_4 * t_sq / 32.0,
+             ik2 * cg_4 * E4 / 8.0 - ik2 * cg_4 * E3,
+             11.0 / 4.0 * ik2 * cg_4 * E2 - 3.0 * ik2 * cg_4 * E1,
+             E1 * ik9 * cg3_4 * t / 4.0,
+             275.0 / 288.0 * ik8 * cg * cg3_cu,
+             709.0 / 288.0 * ik6 * cg_sq * cg3_sq,
+             2.0 * E1 * ik1 * cg_4 * t - E2 * ik1 * cg_4 * t / 2.0,
+             11.0 / 4.0 * ik4 * cg_cu * cg3 - E4 * ik9 * cg3_4 * t / 64.0,
+             E3 * ik9 * cg3_4 * t / 12.0 - 3.0 / 16.0 * E2 * ik9 * cg3_4 * t,
+             11.0 / 6.0 * ik1 * cg_cu,
+             49.0 / 160.0 * ik7 * cg3_cu,
+             5.0 * E1 * ik3 * cg_cu * cg3 * t - E4 * ik7 * cg * cg3_cu * t / 16.0,
+             5.0 / 12.0 * E3 * ik7 * cg * cg3_cu * t,
+             -E4 * ik5 * cg_sq * cg3_sq * t / 16.0 - 9.0 / 8.0 * E2 * ik7 * cg * cg3_cu * t,
+             9.0 / 8.0 * ik2 * cg_4,
+             625.0 / 4608.0 * ik10 * cg3_4]
+    return sum(terms)
+
+
+@functools.lru_cache(maxsize=4096)
+def _v2_symmetric(t, cg, cg1, cg3):
+    return _v2_symmetric_core(t, math.exp(-cg1 * t), cg, cg1, cg3)
+
+
+@functools.lru_cache(maxsize=4096)
+def _correction_terms(t, cg, cg1, cg3):
+    """ All four correction kernels from a single evaluation of E1 = exp(-cg1*t),
+        so series() pays for one exponential per maturity rather than one per term.
+    """
+    E1 = math.exp(-cg1 * t)
+    return (_v1_symmetric_core(t, E1, cg, cg1, cg3),
+            _v1_antisymmetric_core(E1, cg, cg1, cg3),
+            _v2_symmetric_core(t, E1, cg, cg1, cg3),
+            _v2_antisymmetric_core(t, E1, cg, cg1, cg3))
+
+
+if numba is not None:
+    # The straight-line arithmetic cores compile cleanly under nopython mode and the
+    # lru_cache wrappers above pick the compiled versions up through the module globals.
+    _first_order_factor = numba.njit(cache=True, fastmath=True)(_first_order_factor)
+    _sym_numerator = numba.njit(cache=True, fastmath=True)(_sym_numerator)
+    _v1_symmetric_core = numba.njit(cache=True, fastmath=True)(_v1_symmetric_core)
+    _v1_antisymmetric_core = numba.njit(cache=True, fastmath=True)(_v1_antisymmetric_core)
+    _v2_antisymmetric_core = numba.njit(cache=True, fastmath=True)(_v2_antisymmetric_core)
+
+
+@functools.lru_cache(maxsize=128)
+def _v2_symmetric_coefficients(cg, cg1, cg3):
+    """ Coefficients of v2_symmetric regrouped by powers of E1 = exp(-cg1*t), i.e.
+
+          v2_symmetric(t) = a0 + b0*t + c0*t**2 + sum_j (a[j] + b[j]*t) * E1**j
+
+        with b[j] = 0 for j > 4. Scalars only, so the result is cached per parameter set.
+    """
+    ik1 = 1 / cg1
+    ik2 = ik1 * ik1
+    ik3 = ik2 * ik1
+    ik4 = ik2 * ik2
+    ik5 = ik4 * ik1
+    ik6 = ik4 * ik2
+    ik7 = ik4 * ik3
+    ik8 = ik4 * ik4
+    ik9 = ik8 * ik1
+    ik10 = ik8 * ik2
+    cg_sq = cg * cg
+    cg_cu = cg_sq * cg
+    cg_4 = cg_sq * cg_sq
+    cg3_sq = cg3 * cg3
+    cg3_cu = cg3_sq * cg3
+    cg3_4 = cg3_sq * cg3_sq
+    a = (25.0 / 8.0 * ik3 * cg_sq * cg3 + 137.0 / 80.0 * ik5 * cg * cg3_sq
+         + 275.0 / 288.0 * ik8 * cg * cg3_cu + 709.0 / 288.0 * ik6 * cg_sq * cg3_sq
+         + 11.0 / 4.0 * ik4 * cg_cu * cg3 + 11.0 / 6.0 * ik1 * cg_cu
+         + 49.0 / 160.0 * ik7 * cg3_cu + 9.0 / 8.0 * ik2 * cg_4
+         + 625.0 / 4608.0 * ik10 * cg3_4,
+         -6.0 * ik3 * cg_sq * cg3 - 15.0 / 4.0 * ik5 * cg * cg3_sq
+         - 163.0 / 48.0 * ik8 * cg * cg3_cu - 193.0 / 24.0 * ik6 * cg_sq * cg3_sq
+         - 49.0 / 6.0 * ik4 * cg_cu * cg3 - 3.0 * ik1 * cg_cu
+         - 3.0 / 4.0 * ik7 * cg3_cu - 25.0 / 48.0 * ik10 * cg3_4 - 3.0 * ik2 * cg_4,
+         9.0 / 2.0 * ik3 * cg_sq * cg3 + 15.0 / 4.0 * ik5 * cg * cg3_sq
+         + 165.0 / 32.0 * ik8 * cg * cg3_cu + 1021.0 / 96.0 * ik6 * cg_sq * cg3_sq
+         + 55.0 / 6.0 * ik4 * cg_cu * cg3 + 3.0 / 2.0 * ik1 * cg_cu
+         + 15.0 / 16.0 * ik7 * cg3_cu + 57.0 / 64.0 * ik10 * cg3_4
+         + 11.0 / 4.0 * ik2 * cg_4,
+         -2.0 * ik3 * cg_sq * cg3 - 5.0 / 2.0 * ik5 * cg * cg3_sq
+         - 653.0 / 144.0 * ik8 * cg * cg3_cu - 137.0 / 18.0 * ik6 * cg_sq * cg3_sq
+         - 5.0 * ik4 * cg_cu * cg3 - ik1 * cg_cu / 3.0
+         - 5.0 / 6.0 * ik7 * cg3_cu - 133.0 / 144.0 * ik10 * cg3_4 - ik2 * cg_4,
+         3.0 / 8.0 * ik3 * cg_sq * cg3 + 15.0 / 16.0 * ik5 * cg * cg3_sq
+         + 247.0 / 96.0 * ik8 * cg * cg3_cu + 313.0 / 96.0 * ik6 * cg_sq * cg3_sq
+         + 17.0 / 12.0 * ik4 * cg_cu * cg3 + 15.0 / 32.0 * ik7 * cg3_cu
+         + 497.0 / 768.0 * ik10 * cg3_4 + ik2 * cg_4 / 8.0,
+         -3.0 / 20.0 * ik5 * cg * cg3_sq - 15.0 / 16.0 * ik8 * cg * cg3_cu
+         - 19.0 / 24.0 * ik6 * cg_sq * cg3_sq - ik4 * cg_cu * cg3 / 6.0
+         - 3.0 / 20.0 * ik7 * cg3_cu - 5.0 / 16.0 * ik10 * cg3_4,
+         59.0 / 288.0 * ik8 * cg * cg3_cu + 25.0 / 288.0 * ik6 * cg_sq * cg3_sq
+         + ik7 * cg3_cu / 48.0 + 59.0 / 576.0 * ik10 * cg3_4,
+         -ik8 * cg * cg3_cu / 48.0 - ik10 * cg3_4 / 48.0,
+         ik10 * cg3_4 / 512.0)
+    b = (-3.0 / 2.0 * ik2 * cg_sq * cg3 - 3.0 / 4.0 * ik4 * cg * cg3_sq
+         - 47.0 / 48.0 * ik7 * cg * cg3_cu - 131.0 / 48.0 * ik5 * cg_sq * cg3_sq
+         - 10.0 / 3.0 * ik3 * cg_cu * cg3 - cg_cu - ik6 * cg3_cu / 8.0
+         - 25.0 / 192.0 * ik9 * cg3_4 - 3.0 / 2.0 * ik1 * cg_4,
+         7.0 / 4.0 * ik7 * cg * cg3_cu + 9.0 / 2.0 * ik5 * cg_sq * cg3_sq
+         + ik9 * cg3_4 / 4.0 + 2.0 * ik1 * cg_4 + 5.0 * ik3 * cg_cu * cg3,
+         -19.0 / 8.0 * ik5 * cg_sq * cg3_sq - 2.0 * ik3 * cg_cu * cg3
+         - ik1 * cg_4 / 2.0 - 3.0 / 16.0 * ik9 * cg3_4 - 9.0 / 8.0 * ik7 * cg * cg3_cu,
+         2.0 / 3.0 * ik5 * cg_sq * cg3_sq + ik3 * cg_cu * cg3 / 3.0
+         + ik9 * cg3_4 / 12.0 + 5.0 / 12.0 * ik7 * cg * cg3_cu,
+         -ik9 * cg3_4 / 64.0 - ik7 * cg * cg3_cu / 16.0 - ik5 * cg_sq * cg3_sq / 16.0)
+    c0 = (ik6 * cg * cg3_cu / 4.0 + 3.0 / 4.0 * ik4 * cg_sq * cg3_sq
+          + ik2 * cg_cu * cg3 + cg_4 / 2.0 + ik8 * cg3_4 / 32.0)
+    return a, b, c0
+
+
+@functools.lru_cache(maxsize=128)
+def _v2_symmetric_taylor_coefficients(cg, cg1, cg3):
+    """ Coefficients of t**4 .. t**11 in the small-t Taylor expansion of v2_symmetric,
+        so v2_symmetric_approx can run as a Horner evaluation with no pow calls.
+    """
+    c4 = -cg1 ** 3 * cg ** 3 / 4.0
+    c5 = (3.0 / 10.0 * cg1 ** 4 * cg ** 3 - 3.0 / 10.0 * cg1 ** 2 * cg ** 2 * cg3)
+    c6 = (cg1 ** 3 * cg ** 2 * cg3 / 2.0 + cg1 ** 4 * cg ** 4 / 18.0
+          - 5.0 / 24.0 * cg1 ** 5 * cg ** 3 - cg1 * cg * cg3 ** 2 / 8.0)
+    c7 = (3.0 / 28.0 * cg ** 3 * cg1 ** 6 - 13.0 / 28.0 * cg ** 2 * cg1 ** 4 * cg3
+          + 15.0 / 56.0 * cg * cg1 ** 2 * cg3 ** 2 - cg1 ** 5 * cg ** 4 / 12.0
+          - cg3 ** 3 / 56.0 + cg1 ** 3 * cg ** 3 * cg3 / 12.0)
+    c8 = (5.0 / 16.0 * cg ** 2 * cg1 ** 5 * cg3 + 101.0 / 1440.0 * cg1 ** 6 * cg ** 4
+          + 3.0 / 64.0 * cg1 * cg3 ** 3 - 43.0 / 960.0 * cg1 ** 7 * cg ** 3
+          - 5.0 / 16.0 * cg1 ** 3 * cg * cg3 ** 2 - 13.0 / 80.0 * cg1 ** 4 * cg ** 3 * cg3
+          + 23.0 / 480.0 * cg1 ** 2 * cg ** 2 * cg3 ** 2)
+    c9 = (-27.0 / 160.0 * cg1 ** 6 * cg ** 2 * cg3 + 25.0 / 144.0 * cg1 ** 5 * cg ** 3 * cg3
+          + cg1 * cg * cg3 ** 3 / 80.0 - 31.0 / 720.0 * cg1 ** 7 * cg ** 4
+          - 19.0 / 288.0 * cg1 ** 2 * cg3 ** 3 + 23.0 / 1440.0 * cg1 ** 8 * cg ** 3
+          + 25.0 / 96.0 * cg1 ** 4 * cg * cg3 ** 2 - 83.0 / 720.0 * cg1 ** 3 * cg ** 2 * cg3 ** 2)
+    c10 = (-373.0 / 2800.0 * cg ** 3 * cg1 ** 6 * cg3 + 7537.0 / 50400.0 * cg ** 2 * cg1 ** 4 * cg3 ** 2
+           - 43.0 / 1200.0 * cg * cg1 ** 2 * cg3 ** 3 - 121.0 / 24192.0 * cg ** 3 * cg1 ** 9
+           + 21.0 / 320.0 * cg1 ** 3 * cg3 ** 3 + 403.0 / 18900.0 * cg ** 4 * cg1 ** 8
+           + cg3 ** 4 / 800.0 + 37.0 / 480.0 * cg ** 2 * cg1 ** 7 * cg3
+           - 331.0 / 1920.0 * cg * cg1 ** 5 * cg3 ** 2)
+    c11 = (23.0 / 420.0 * cg1 ** 3 * cg * cg3 ** 3 - 181.0 / 20160.0 * cg1 ** 9 * cg ** 4
+           - 463.0 / 3360.0 * cg1 ** 5 * cg ** 2 * cg3 ** 2 - 6821.0 / 221760.0 * cg1 ** 8 * cg ** 2 * cg3
+           + 47.0 / 576.0 * cg1 ** 7 * cg ** 3 * cg3 + 311.0 / 221760.0 * cg1 ** 10 * cg ** 3
+           - cg1 * cg3 ** 4 / 240.0 - 1087.0 / 21120.0 * cg1 ** 4 * cg3 ** 3
+           + 135.0 / 1408.0 * cg1 ** 6 * cg * cg3 ** 2)
+    return c4, c5, c6, c7, c8, c9, c10, c11
+
+
+_V2_SYM_HORNER = ('{a0} + t*({b0} + t*{c0})'
+                  ' + E1*({a1} + t*{b1} + E1*({a2} + t*{b2} + E1*({a3} + t*{b3}'
+                  ' + E1*({a4} + t*{b4} + E1*({a5} + E1*({a6} + E1*({a7} + E1*{a8})))))))')
+
+
+def _specialize_v2_symmetric(cg, cg1, cg3):
+    """ exec a v2_symmetric specialized to one parameter set: every coefficient is
+        folded into a float literal at build time so only t varies at call time.
+    """
+    a, b, c0 = _v2_symmetric_coefficients(cg, cg1, cg3)
+    # float() before repr so numpy-typed parameters still embed as plain literals
+    literals = {'a' + str(j): repr(float(aj)) for j, aj in enumerate(a)}
+    literals.update({'b' + str(j): repr(float(bj)) for j, bj in enumerate(b)})
+    literals.update({'c0': repr(float(c0)), 'neg_cg1': repr(float(-cg1))})
+    source = ('def _v2_symmetric_fixed(t, _exp=math.exp):\n'
+              '    E1 = _exp({neg_cg1} * t)\n'
+              '    return ({horner})\n').format(horner=_V2_SYM_HORNER.format(**literals),
+                                                **literals)
+    namespace = {'math': math}
+    exec(compile(source, '<v2_symmetric specialization>', 'exec'), namespace)
+    return namespace['_v2_symmetric_fixed']
+
+
 class RegimeSwitchingModel():
     """ Analytic approximation to survival under regime switching OU process with stochastic mean level and volatility both
         dependent on the same two state regime s which switches with intensity lmbda. This class exists to compute an
@@ -21,7 +352,13 @@ class RegimeSwitchingModel():
         self.theta_under = 0.5*( thetas[0]-thetas[1])
         self.ss_under    = 0.5*( sigmas[0]**2 -sigmas[1]**2 )
         self.epsilon     = 1/lmbd
+        self.epsilon_sq  = self.epsilon**2
         self.sigmas      = sigmas
+        # Parameter-only constants reused per call
+        self._a0_slope   = self.theta_bar - self.ss_bar/(2*kappa**2)
+        self._ss_over_4k = self.ss_bar/(4*kappa)
+        self._v2_symmetric_fast = _specialize_v2_symmetric(self.theta_under, kappa, self.ss_under)
+        self._v2_taylor  = _v2_symmetric_taylor_coefficients(self.theta_under, kappa, self.ss_under)
 
     def as_latex(self):
         """ Describe tests parameters in latex suitable for plot titles """
@@ -34,36 +371,36 @@ class RegimeSwitchingModel():
         return r', '.join(titles)
 
     def tau(self,t):
-        return (1-math.exp(-self.kappa*t))/self.kappa
+        return _tau(t, self.kappa)
 
     def a0(self,t):
-        tau_ = self.tau(t)
-        return (self.theta_bar - self.ss_bar/(2*self.kappa**2) )*(tau_-t) - (self.ss_bar*tau_**2)/(4*self.kappa)
+        return _a0(t, self.kappa, self.theta_bar, self.ss_bar)
 
     def series(self,t,x,s):
         u0 = self.u0(t,x)
-        epsilon = 1 / self.lmbd
+        epsilon = self.epsilon
+        epsilon_sq = self.epsilon_sq
         pm = 1 if s == 0 else -1  # Plus or minus
+        v1s, v1a, v2s, v2a = _correction_terms(t, self.theta_under, self.kappa, self.ss_under)
         return [ u0,
-                 u0*epsilon*self.v1_symmetric(t),
-                 u0*epsilon*pm*self.v1_antisymmetric(t),
-                 u0*epsilon**2*self.v2_symmetric(t),
-                 u0*epsilon**2*pm*self.v2_antisymmetric(t) ]
+                 u0*epsilon*v1s,
+                 u0*epsilon*pm*v1a,
+                 u0*epsilon_sq*v2s,
+                 u0*epsilon_sq*pm*v2a ]
 
     def u(self,t,x,s):
         """ Estimate survival probability within O(1/lmbd^3) """
-        series = self.series(t=t,x=x,s=s)
-        return np.nansum(series)
+        s0, s1, s2, s3, s4 = self.series(t=t,x=x,s=s)
+        return s0 + s1 + s2 + s3 + s4
 
     def u0(self,t,x):
-        return math.exp(self.a0(t)-self.tau(t)*x)
+        return _u0(t, x, self.kappa, self.theta_bar, self.ss_bar)
 
     def u0_check(self,t,x):
         K_     = self.kappa
         tau_   = (1 - np.exp(-K_ * t)) / K_
-        ss_bar = self.ss_bar
-        A = np.exp(  (self.theta_bar - ss_bar / (2 * K_ ** 2)) * (tau_ - t) - (ss_bar) / (4 * K_) * tau_ ** 2)
-        return A * np.exp(-x * tau_)
+        a0_ = self._a0_slope * (tau_ - t) - self._ss_over_4k * tau_ ** 2
+        return np.exp(a0_ - x * tau_)
 
     def v1_antisymmetric(self,t):
         """
@@ -71,11 +408,7 @@ class RegimeSwitchingModel():
         :param t:
         :return:
         """
-        exp = math.exp
-        cg = self.theta_under
-        cg1 = self.kappa
-        cg3 = self.ss_under
-        return (cg * (0.1e1 - exp(-cg1 * t)) + cg3 * (0.1e1 - exp(-cg1 * t)) ** 2 / cg1 ** 2 / 0.2e1) ** 2
+        return _v1_antisymmetric(t, self.theta_under, self.kappa, self.ss_under)
 
     def v1_symmetric(self,t):
         """
@@ -84,35 +417,10 @@ cg3 = ((-24 * cg ^ 2 * cg1 ^ 4 - 72 * cg * cg1 ^ 2 * cg4 - 36 * cg4 ^ 2) * exp(-
         :param t:
         :return:
         """
-        cg  = self.theta_under
-        cg1 = self.kappa
-        cg4 = self.ss_under
-        exp = math.exp
-        return ((-24 * cg ** 2 * cg1 ** 4 - 72 * cg * cg1 ** 2 * cg4 - 36 * cg4 ** 2) * exp(-(2 * cg1 * t)) + (
-                    96 * cg ** 2 * cg1 ** 4 + 144 * cg * cg1 ** 2 * cg4 + 48 * cg4 ** 2) * exp(
-            -(cg1 * t)) + 0.16e2 * cg4 * (cg * cg1 ** 2 + cg4) * exp(-(3 * cg1 * t)) + (48 * cg ** 2 * cg1 ** 5 * t) - (
-                           72 * cg ** 2 * cg1 ** 4) + (48 * cg * cg1 ** 3 * cg4 * t) - (88 * cg * cg1 ** 2 * cg4) + (
-                           12 * cg1 * cg4 ** 2 * t) - 0.3e1 * (cg4 ** 2) * exp(-(4 * cg1 * t)) - (25 * cg4 ** 2)) / (
-                          cg1**5) / 0.48e2
+        return _v1_symmetric(t, self.theta_under, self.kappa, self.ss_under)
 
     def v2_antisymmetric(self,t):
-        cg  = self.theta_under
-        cg1 = self.kappa
-        cg3 = self.ss_under
-        exp = math.exp
-        return -(-0.2e1 * (-24 * cg ** 2 * cg1 ** 4 - 72 * cg * cg1 ** 2 * cg3 - 36 * cg3 ** 2) * cg1 * exp(
-            -(2 * cg1 * t)) - (96 * cg ** 2 * cg1 ** 4 + 144 * cg * cg1 ** 2 * cg3 + 48 * cg3 ** 2) * cg1 * exp(
-            -(cg1 * t)) - 0.48e2 * cg3 * (cg * cg1 ** 2 + cg3) * cg1 * exp(-(3 * cg1 * t)) + (48 * cg ** 2 * cg1 ** 5) + (
-                            48 * cg * cg1 ** 3 * cg3) + (12 * cg1 * cg3 ** 2) + 0.12e2 * (cg3 ** 2) * cg1 * exp(
-            -(4 * cg1 * t))) / (cg1 ** 5) / 0.48e2 + (
-                          cg * (0.1e1 - exp(-(cg1 * t))) + cg3 * (0.1e1 - exp(-(cg1 * t))) ** 2 / (cg1 ** 2) / 0.2e1) * (
-                          (-24 * cg ** 2 * cg1 ** 4 - 72 * cg * cg1 ** 2 * cg3 - 36 * cg3 ** 2) * exp(-(2 * cg1 * t)) + (
-                              96 * cg ** 2 * cg1 ** 4 + 144 * cg * cg1 ** 2 * cg3 + 48 * cg3 ** 2) * exp(
-                      -(cg1 * t)) + 0.16e2 * cg3 * (cg * cg1 ** 2 + cg3) * exp(-(3 * cg1 * t)) + (
-                                      48 * cg ** 2 * cg1 ** 5 * t) - (72 * cg ** 2 * cg1 ** 4) + (
-                                      48 * cg * cg1 ** 3 * cg3 * t) - (88 * cg * cg1 ** 2 * cg3) + (
-                                      12 * cg1 * cg3 ** 2 * t) - 0.3e1 * (cg3 ** 2) * exp(-(4 * cg1 * t)) - (
-                                      25 * cg3 ** 2)) / (cg1 ** 5) / 0.48e2
+        return _v2_antisymmetric(t, self.theta_under, self.kappa, self.ss_under)
 
 
 
@@ -121,6 +429,13 @@ cg3 = ((-24 * cg ^ 2 * cg1 ^ 4 - 72 * cg * cg1 ^ 2 * cg4 - 36 * cg4 ^ 2) * exp(-
         :param t: Time  (maturity
         :return: Taylor series approx
         """
+        c4, c5, c6, c7, c8, c9, c10, c11 = self._v2_taylor
+        t2 = t * t
+        t4 = t2 * t2
+        return t4 * (c4 + t*(c5 + t*(c6 + t*(c7 + t*(c8 + t*(c9 + t*(c10 + t*c11)))))))
+
+    def _v2_symmetric_approx_expanded(self,t):
+        """ Original expanded form of v2_symmetric_approx, kept as a cross-check """
         cg = self.theta_under
         cg3 = self.ss_under
         cg1  = self.kappa
@@ -134,85 +449,60 @@ cg3 = ((-24 * cg ^ 2 * cg1 ^ 4 - 72 * cg * cg1 ^ 2 * cg4 - 36 * cg4 ^ 2) * exp(-
                           0.23e2 / 0.420e3 * cg1 ** 3 * cg * cg3 ** 3 - 0.181e3 / 0.20160e5 * cg1 ** 9 * cg ** 4 - 0.463e3 / 0.3360e4 * cg1 ** 5 * cg ** 2 * cg3 ** 2 - 0.6821e4 / 0.221760e6 * cg1 ** 8 * cg ** 2 * cg3 + 0.47e2 / 0.576e3 * cg1 ** 7 * cg ** 3 * cg3 + 0.311e3 / 0.221760e6 * cg1 ** 10 * cg ** 3 - cg1 * cg3 ** 4 / 0.240e3 - 0.1087e4 / 0.21120e5 * cg1 ** 4 * cg3 ** 3 + 0.135e3 / 0.1408e4 * cg1 ** 6 * cg * cg3 ** 2) * t ** 11
 
     def v2_symmetric(self,t):
-        """ Second order symmetric correction term """
-        cg = self.theta_under
-        cg1 = self.kappa
-        cg3 = self.ss_under
-        exp = math.exp
-        # terms = [ 0.25e2 / 0.8e1 / cg1 ** 3 * cg ** 2 * cg3  ,    0.137e3 / 0.80e2 / cg1 ** 5 * cg * cg3 ** 2 , 0.9e1 / 0.2e1 / cg1 ** 3 / exp(cg1 * t) ** 2 * cg ** 2 * cg3 - 0.6e1 / cg1 ** 3 / exp(cg1 * t) * cg ** 2 * cg3 - 0.2e1 / cg1 ** 3 * cg3 / exp(cg1 * t) ** 3 * cg ** 2 - 0.3e1 / 0.2e1 / cg1 ** 2 * cg ** 2 * cg3 * t - 0.3e1 / 0.4e1 / cg1 ** 4 * cg * cg3 ** 2 * t , 0.3e1 / 0.8e1 / cg1 ** 3 * cg ** 2 / exp(cg1 * t) ** 4 * cg3 , 0.15e2 / 0.4e1 / cg1 ** 5 * cg / exp(cg1 * t) ** 2 * cg3 ** 2 - 0.15e2 / 0.4e1 / cg1 ** 5 * cg / exp(cg1 * t) * cg3 ** 2 - 0.5e1 / 0.2e1 / cg1 ** 5 * cg * cg3 ** 2 / exp(cg1 * t) ** 3 , 0.15e2 / 0.16e2 / cg1 ** 5 * cg * cg3 ** 2 / exp(cg1 * t) ** 4 - 0.3e1 / 0.20e2 / cg1 ** 5 * cg / exp(cg1 * t) ** 5 * cg3 ** 2 - 0.47e2 / 0.48e2 / cg1 ** 7 * cg * cg3 ** 3 * t - 0.131e3 / 0.48e2 / cg1 ** 5 * cg ** 2 * cg3 ** 2 * t - 0.10e2 / 0.3e1 / cg1 ** 3 * cg ** 3 * cg3 * t , 0.59e2 / 0.288e3 / cg1 ** 8 * cg * cg3 ** 3 / exp(cg1 * t) ** 6 - 0.15e2 / 0.16e2 / cg1 ** 8 * cg * cg3 ** 3 / exp(cg1 * t) ** 5 , 0.165e3 / 0.32e2 / cg1 ** 8 * cg * cg3 ** 3 / exp(cg1 * t) ** 2 - 0.163e3 / 0.48e2 / cg1 ** 8 * cg * cg3 ** 3 / exp(cg1 * t) - 0.1e1 / cg1 ** 8 * cg * cg3 ** 3 / exp(cg1 * t) ** 7 / 0.48e2 , 0.247e3 / 0.96e2 / cg1 ** 8 * cg * cg3 ** 3 / exp(cg1 * t) ** 4 - 0.653e3 / 0.144e3 / cg1 ** 8 * cg * cg3 ** 3 / exp(cg1 * t) ** 3 , 0.1e1 / cg1 ** 6 * cg * cg3 ** 3 * t ** 2 / 0.4e1 , 0.1021e4 / 0.96e2 / cg1 ** 6 * cg ** 2 * cg3 ** 2 / exp(cg1 * t) ** 2 - 0.193e3 / 0.24e2 / cg1 ** 6 * cg ** 2 * cg3 ** 2 / exp(cg1 * t) , 0.25e2 / 0.288e3 / cg1 ** 6 * cg ** 2 * cg3 ** 2 / exp(cg1 * t) ** 6 - 0.19e2 / 0.24e2 / cg1 ** 6 * cg ** 2 * cg3 ** 2 / exp(cg1 * t) ** 5 , 0.313e3 / 0.96e2 / cg1 ** 6 * cg ** 2 * cg3 ** 2 / exp(cg1 * t) ** 4 - 0.137e3 / 0.18e2 / cg1 ** 6 * cg ** 2 * cg3 ** 2 / exp(cg1 * t) ** 3 , 0.3e1 / 0.4e1 / cg1 ** 4 * cg ** 2 * cg3 ** 2 * t ** 2 - 0.49e2 / 0.6e1 / cg1 ** 4 * cg ** 3 * cg3 / exp(cg1 * t) - 0.1e1 / cg1 ** 4 * cg ** 3 * cg3 / exp(cg1 * t) ** 5 / 0.6e1 , 0.17e2 / 0.12e2 / cg1 ** 4 * cg ** 3 * cg3 / exp(cg1 * t) ** 4 - 0.5e1 / cg1 ** 4 * cg ** 3 * cg3 / exp(cg1 * t) ** 3 , 0.55e2 / 0.6e1 / cg1 ** 4 * cg ** 3 * cg3 / exp(cg1 * t) ** 2 , 0.1e1 / cg1 ** 2 * cg ** 3 * cg3 * t ** 2 - 0.19e2 / 0.8e1 / exp(cg1 * t) ** 2 / cg1 ** 5 * cg ** 2 * cg3 ** 2 * t , 0.7e1 / 0.4e1 / exp(cg1 * t) / cg1 ** 7 * cg * cg3 ** 3 * t , 0.2e1 / 0.3e1 / exp(cg1 * t) ** 3 / cg1 ** 5 * cg ** 2 * cg3 ** 2 * t , 0.1e1 / exp(cg1 * t) ** 3 / cg1 ** 3 * cg ** 3 * cg3 * t / 0.3e1 , 0.9e1 / 0.2e1 / exp(cg1 * t) / cg1 ** 5 * cg ** 2 * cg3 ** 2 * t - 0.2e1 / exp(cg1 * t) ** 2 / cg1 ** 3 * cg ** 3 * cg3 * t , cg ** 4 * t ** 2 / 0.2e1 - cg ** 3 * t , 0.3e1 / 0.2e1 / cg1 / exp(cg1 * t) ** 2 * cg ** 3 - 0.3e1 / cg1 / exp(cg1 * t) * cg ** 3 - 0.1e1 / cg1 * cg ** 3 / exp(cg1 * t) ** 3 / 0.3e1 , 0.15e2 / 0.16e2 / cg1 ** 7 * cg3 ** 3 / exp(cg1 * t) ** 2 - 0.3e1 / 0.4e1 / cg1 ** 7 * cg3 ** 3 / exp(cg1 * t) - 0.5e1 / 0.6e1 / cg1 ** 7 * cg3 ** 3 / exp(cg1 * t) ** 3 - 0.1e1 / cg1 ** 6 * cg3 ** 3 * t / 0.8e1 , 0.15e2 / 0.32e2 / cg1 ** 7 * cg3 ** 3 / exp(cg1 * t) ** 4 - 0.3e1 / 0.20e2 / cg1 ** 7 * cg3 ** 3 / exp(cg1 * t) ** 5 , 0.1e1 / cg1 ** 7 * cg3 ** 3 / exp(cg1 * t) ** 6 / 0.48e2 - 0.25e2 / 0.192e3 / cg1 ** 9 * cg3 ** 4 * t - 0.3e1 / 0.2e1 / cg1 * cg ** 4 * t , 0.1e1 / cg1 ** 10 * cg3 ** 4 / exp(cg1 * t) ** 8 / 0.512e3 - 0.1e1 / cg1 ** 10 * cg3 ** 4 / exp(cg1 * t) ** 7 / 0.48e2 , 0.59e2 / 0.576e3 / cg1 ** 10 * cg3 ** 4 / exp(cg1 * t) ** 6 - 0.5e1 / 0.16e2 / cg1 ** 10 * cg3 ** 4 / exp(cg1 * t) ** 5 , 0.497e3 / 0.768e3 / cg1 ** 10 * cg3 ** 4 / exp(cg1 * t) ** 4 - 0.133e3 / 0.144e3 / cg1 ** 10 * cg3 ** 4 / exp(cg1 * t) ** 3 , 0.57e2 / 0.64e2 / cg1 ** 10 * cg3 ** 4 / exp(cg1 * t) ** 2 - 0.25e2 / 0.48e2 / cg1 ** 10 * cg3 ** 4 / exp(cg1 * t) , 0.1e1 / cg1 ** 8 * cg3 ** 4 * t ** 2 / 0.32e2 , 0.1e1 / cg1 ** 2 * cg ** 4 / exp(cg1 * t) ** 4 / 0.8e1 - 0.1e1 / cg1 ** 2 * cg ** 4 / exp(cg1 * t) ** 3 , 0.11e2 / 0.4e1 / cg1 ** 2 * cg ** 4 / exp(cg1 * t) ** 2 - 0.3e1 / cg1 ** 2 * cg ** 4 / exp(cg1 * t) , 0.1e1 / exp(cg1 * t) / cg1 ** 9 * cg3 ** 4 * t / 0.4e1 , 0.275e3 / 0.288e3 / cg1 ** 8 * cg * cg3 ** 3 , 0.709e3 / 0.288e3 / cg1 ** 6 * cg ** 2 * cg3 ** 2 , 0.2e1 / exp(cg1 * t) / cg1 * cg ** 4 * t - 0.1e1 / exp(cg1 * t) ** 2 / cg1 * cg ** 4 * t / 0.2e1 , 0.11e2 / 0.4e1 / cg1 ** 4 * cg ** 3 * cg3 - 0.1e1 / exp(cg1 * t) ** 4 / cg1 ** 9 * cg3 ** 4 * t / 0.64e2 , 0.1e1 / exp(cg1 * t) ** 3 / cg1 ** 9 * cg3 ** 4 * t / 0.12e2 - 0.3e1 / 0.16e2 / exp(cg1 * t) ** 2 / cg1 ** 9 * cg3 ** 4 * t , 0.11e2 / 0.6e1 / cg1 * cg ** 3 , 0.49e2 / 0.160e3 / cg1 ** 7 * cg3 ** 3 , 0.5e1 / exp(cg1 * t) / cg1 ** 3 * cg ** 3 * cg3 * t - 0.1e1 / exp(cg1 * t) ** 4 / cg1 ** 7 * cg * cg3 ** 3 * t / 0.16e2 , 0.5e1 / 0.12e2 / exp(cg1 * t) ** 3 / cg1 ** 7 * cg * cg3 ** 3 * t - 0.1e1 / exp(cg1 * t) ** 4 / cg1 ** 5 * cg ** 2 * cg3 ** 2 * t / 0.16e2 - 0.9e1 / 0.8e1 / exp(cg1 * t) ** 2 / cg1 ** 7 * cg * cg3 ** 3 * t , 0.9e1 / 0.8e1 / cg1 ** 2 * cg ** 4 , 0.625e3 / 0.4608e4 / cg1 ** 10 * cg3 ** 4 ]
-        terms = [0.25e2 / 0.8e1 / cg1 ** 3 * cg ** 2 * cg3, 0.137e3 / 0.80e2 / cg1 ** 5 * cg * cg3 ** 2,
-                 0.9e1 / 0.2e1 / cg1 ** 3 / exp(cg1 * t) ** 2 * cg ** 2 * cg3 - 0.6e1 / cg1 ** 3 / exp(
-                     cg1 * t) * cg ** 2 * cg3 - 0.2e1 / cg1 ** 3 * cg3 / exp(
-                     cg1 * t) ** 3 * cg ** 2 - 0.3e1 / 0.2e1 / cg1 ** 2 * cg ** 2 * cg3 * t - 0.3e1 / 0.4e1 / cg1 ** 4 * cg * cg3 ** 2 * t,
-                 0.3e1 / 0.8e1 / cg1 ** 3 * cg ** 2 / exp(cg1 * t) ** 4 * cg3,
-                 0.15e2 / 0.4e1 / cg1 ** 5 * cg / exp(cg1 * t) ** 2 * cg3 ** 2 - 0.15e2 / 0.4e1 / cg1 ** 5 * cg / exp(
-                     cg1 * t) * cg3 ** 2 - 0.5e1 / 0.2e1 / cg1 ** 5 * cg * cg3 ** 2 / exp(cg1 * t) ** 3,
-                 0.15e2 / 0.16e2 / cg1 ** 5 * cg * cg3 ** 2 / exp(cg1 * t) ** 4 - 0.3e1 / 0.20e2 / cg1 ** 5 * cg / exp(
-                     cg1 * t) ** 5 * cg3 ** 2 - 0.47e2 / 0.48e2 / cg1 ** 7 * cg * cg3 ** 3 * t - 0.131e3 / 0.48e2 / cg1 ** 5 * cg ** 2 * cg3 ** 2 * t - 0.10e2 / 0.3e1 / cg1 ** 3 * cg ** 3 * cg3 * t,
-                 0.59e2 / 0.288e3 / cg1 ** 8 * cg * cg3 ** 3 / exp(
-                     cg1 * t) ** 6 - 0.15e2 / 0.16e2 / cg1 ** 8 * cg * cg3 ** 3 / exp(cg1 * t) ** 5,
-                 0.165e3 / 0.32e2 / cg1 ** 8 * cg * cg3 ** 3 / exp(
-                     cg1 * t) ** 2 - 0.163e3 / 0.48e2 / cg1 ** 8 * cg * cg3 ** 3 / exp(
-                     cg1 * t) - 0.1e1 / cg1 ** 8 * cg * cg3 ** 3 / exp(cg1 * t) ** 7 / 0.48e2,
-                 0.247e3 / 0.96e2 / cg1 ** 8 * cg * cg3 ** 3 / exp(
-                     cg1 * t) ** 4 - 0.653e3 / 0.144e3 / cg1 ** 8 * cg * cg3 ** 3 / exp(cg1 * t) ** 3,
-                 0.1e1 / cg1 ** 6 * cg * cg3 ** 3 * t ** 2 / 0.4e1,
-                 0.1021e4 / 0.96e2 / cg1 ** 6 * cg ** 2 * cg3 ** 2 / exp(
-                     cg1 * t) ** 2 - 0.193e3 / 0.24e2 / cg1 ** 6 * cg ** 2 * cg3 ** 2 / exp(cg1 * t),
-                 0.25e2 / 0.288e3 / cg1 ** 6 * cg ** 2 * cg3 ** 2 / exp(
-                     cg1 * t) ** 6 - 0.19e2 / 0.24e2 / cg1 ** 6 * cg ** 2 * cg3 ** 2 / exp(cg1 * t) ** 5,
-                 0.313e3 / 0.96e2 / cg1 ** 6 * cg ** 2 * cg3 ** 2 / exp(
-                     cg1 * t) ** 4 - 0.137e3 / 0.18e2 / cg1 ** 6 * cg ** 2 * cg3 ** 2 / exp(cg1 * t) ** 3,
-                 0.3e1 / 0.4e1 / cg1 ** 4 * cg ** 2 * cg3 ** 2 * t ** 2 - 0.49e2 / 0.6e1 / cg1 ** 4 * cg ** 3 * cg3 / exp(
-                     cg1 * t) - 0.1e1 / cg1 ** 4 * cg ** 3 * cg3 / exp(cg1 * t) ** 5 / 0.6e1,
-                 0.17e2 / 0.12e2 / cg1 ** 4 * cg ** 3 * cg3 / exp(
-                     cg1 * t) ** 4 - 0.5e1 / cg1 ** 4 * cg ** 3 * cg3 / exp(cg1 * t) ** 3,
-                 0.55e2 / 0.6e1 / cg1 ** 4 * cg ** 3 * cg3 / exp(cg1 * t) ** 2,
-                 0.1e1 / cg1 ** 2 * cg ** 3 * cg3 * t ** 2 - 0.19e2 / 0.8e1 / exp(
-                     cg1 * t) ** 2 / cg1 ** 5 * cg ** 2 * cg3 ** 2 * t,
-                 0.7e1 / 0.4e1 / exp(cg1 * t) / cg1 ** 7 * cg * cg3 ** 3 * t,
-                 0.2e1 / 0.3e1 / exp(cg1 * t) ** 3 / cg1 ** 5 * cg ** 2 * cg3 ** 2 * t,
-                 0.1e1 / exp(cg1 * t) ** 3 / cg1 ** 3 * cg ** 3 * cg3 * t / 0.3e1,
-                 0.9e1 / 0.2e1 / exp(cg1 * t) / cg1 ** 5 * cg ** 2 * cg3 ** 2 * t - 0.2e1 / exp(
-                     cg1 * t) ** 2 / cg1 ** 3 * cg ** 3 * cg3 * t, cg ** 4 * t ** 2 / 0.2e1 - cg ** 3 * t,
-                 0.3e1 / 0.2e1 / cg1 / exp(cg1 * t) ** 2 * cg ** 3 - 0.3e1 / cg1 / exp(
-                     cg1 * t) * cg ** 3 - 0.1e1 / cg1 * cg ** 3 / exp(cg1 * t) ** 3 / 0.3e1,
-                 0.15e2 / 0.16e2 / cg1 ** 7 * cg3 ** 3 / exp(cg1 * t) ** 2 - 0.3e1 / 0.4e1 / cg1 ** 7 * cg3 ** 3 / exp(
-                     cg1 * t) - 0.5e1 / 0.6e1 / cg1 ** 7 * cg3 ** 3 / exp(
-                     cg1 * t) ** 3 - 0.1e1 / cg1 ** 6 * cg3 ** 3 * t / 0.8e1,
-                 0.15e2 / 0.32e2 / cg1 ** 7 * cg3 ** 3 / exp(cg1 * t) ** 4 - 0.3e1 / 0.20e2 / cg1 ** 7 * cg3 ** 3 / exp(
-                     cg1 * t) ** 5, 0.1e1 / cg1 ** 7 * cg3 ** 3 / exp(
-                cg1 * t) ** 6 / 0.48e2 - 0.25e2 / 0.192e3 / cg1 ** 9 * cg3 ** 4 * t - 0.3e1 / 0.2e1 / cg1 * cg ** 4 * t]
-        try:
-            difficult_terms = [0.1e1 / cg1 ** 10 * cg3 ** 4 / exp(cg1 * t) ** 8 / 0.512e3 - 0.1e1 / cg1 ** 10 * cg3 ** 4 / exp(
-                     cg1 * t) ** 7 / 0.48e2, 0.59e2 / 0.576e3 / cg1 ** 10 * cg3 ** 4 / exp(
-                cg1 * t) ** 6 - 0.5e1 / 0.16e2 / cg1 ** 10 * cg3 ** 4 / exp(cg1 * t) ** 5,
-                 0.497e3 / 0.768e3 / cg1 ** 10 * cg3 ** 4 / exp(
-                     cg1 * t) ** 4 - 0.133e3 / 0.144e3 / cg1 ** 10 * cg3 ** 4 / exp(cg1 * t) ** 3,
-                 0.57e2 / 0.64e2 / cg1 ** 10 * cg3 ** 4 / exp(
-                     cg1 * t) ** 2 - 0.25e2 / 0.48e2 / cg1 ** 10 * cg3 ** 4 / exp(cg1 * t),
-                 0.1e1 / cg1 ** 8 * cg3 ** 4 * t ** 2 / 0.32e2,
-                 0.1e1 / cg1 ** 2 * cg ** 4 / exp(cg1 * t) ** 4 / 0.8e1 - 0.1e1 / cg1 ** 2 * cg ** 4 / exp(
-                     cg1 * t) ** 3,
-                 0.11e2 / 0.4e1 / cg1 ** 2 * cg ** 4 / exp(cg1 * t) ** 2 - 0.3e1 / cg1 ** 2 * cg ** 4 / exp(cg1 * t),
-                 0.1e1 / exp(cg1 * t) / cg1 ** 9 * cg3 ** 4 * t / 0.4e1, 0.275e3 / 0.288e3 / cg1 ** 8 * cg * cg3 ** 3,
-                 0.709e3 / 0.288e3 / cg1 ** 6 * cg ** 2 * cg3 ** 2,
-                 0.2e1 / exp(cg1 * t) / cg1 * cg ** 4 * t - 0.1e1 / exp(cg1 * t) ** 2 / cg1 * cg ** 4 * t / 0.2e1,
-                 0.11e2 / 0.4e1 / cg1 ** 4 * cg ** 3 * cg3 - 0.1e1 / exp(
-                     cg1 * t) ** 4 / cg1 ** 9 * cg3 ** 4 * t / 0.64e2,
-                 0.1e1 / exp(cg1 * t) ** 3 / cg1 ** 9 * cg3 ** 4 * t / 0.12e2 - 0.3e1 / 0.16e2 / exp(
-                     cg1 * t) ** 2 / cg1 ** 9 * cg3 ** 4 * t, 0.11e2 / 0.6e1 / cg1 * cg ** 3,
-                 0.49e2 / 0.160e3 / cg1 ** 7 * cg3 ** 3,
-                 0.5e1 / exp(cg1 * t) / cg1 ** 3 * cg ** 3 * cg3 * t - 0.1e1 / exp(
-                     cg1 * t) ** 4 / cg1 ** 7 * cg * cg3 ** 3 * t / 0.16e2,
-                 0.5e1 / 0.12e2 / exp(cg1 * t) ** 3 / cg1 ** 7 * cg * cg3 ** 3 * t,
-                 - 0.1e1 / exp(
-                     cg1 * t) ** 4 / cg1 ** 5 * cg ** 2 * cg3 ** 2 * t / 0.16e2 - 0.9e1 / 0.8e1 / exp(
-                     cg1 * t) ** 2 / cg1 ** 7 * cg * cg3 ** 3 * t, 0.9e1 / 0.8e1 / cg1 ** 2 * cg ** 4 ]
-        except:
-            print('Warning ... discarding some terms')
-            difficult_terms = [0]
-        return sum(terms+difficult_terms)
+        """ Second order symmetric correction term, via the exec-specialized closure """
+        return self._v2_symmetric_fast(t)
+
+    def series_vec(self,ts,x,s):
+        """ series() for a NumPy array of times, returned as a (5, n) array """
+        ts = np.asarray(ts, dtype=float)
+        E1 = np.exp(-self.kappa * ts)
+        tau_ = (1 - E1) / self.kappa
+        a0_ = self._a0_slope * (tau_ - ts) - self._ss_over_4k * tau_ ** 2
+        u0 = np.exp(a0_ - x * tau_)
+        pm = 1 if s == 0 else -1  # Plus or minus
+        return np.stack([u0,
+                         u0*self.epsilon*self.v1_symmetric_vec(ts, E1),
+                         u0*self.epsilon*pm*self.v1_antisymmetric_vec(ts, E1),
+                         u0*self.epsilon_sq*self.v2_symmetric_vec(ts, E1),
+                         u0*self.epsilon_sq*pm*self.v2_antisymmetric_vec(ts, E1)])
+
+    def u_vec(self,ts,x,s):
+        """ u() for a NumPy array of times """
+        return self.series_vec(ts, x, s).sum(axis=0)
+
+    def v1_symmetric_vec(self,ts,E1=None):
+        """ v1_symmetric evaluated for a NumPy array of times in one shot """
+        ts = np.asarray(ts)
+        if E1 is None:
+            E1 = np.exp(-self.kappa * ts)
+        return _v1_symmetric_core(ts, E1, self.theta_under, self.kappa, self.ss_under)
+
+    def v1_antisymmetric_vec(self,ts,E1=None):
+        """ v1_antisymmetric evaluated for a NumPy array of times in one shot """
+        ts = np.asarray(ts)
+        if E1 is None:
+            E1 = np.exp(-self.kappa * ts)
+        return _v1_antisymmetric_core(E1, self.theta_under, self.kappa, self.ss_under)
+
+    def v2_symmetric_vec(self,ts,E1=None):
+        """ v2_symmetric evaluated for a NumPy array of times in one shot """
+        ts = np.asarray(ts)
+        if E1 is None:
+            E1 = np.exp(-self.kappa * ts)
+        if numexpr is None:
+            return _v2_symmetric_core(ts, E1, self.theta_under, self.kappa, self.ss_under)
+        a, b, c0 = _v2_symmetric_coefficients(self.theta_under, self.kappa, self.ss_under)
+        local_dict = {'t': ts, 'E1': E1, 'c0': c0}
+        local_dict.update({'a' + str(j): aj for j, aj in enumerate(a)})
+        local_dict.update({'b' + str(j): bj for j, bj in enumerate(b)})
+        return numexpr.evaluate(_V2_SYM_HORNER.replace('{', '').replace('}', ''), local_dict=local_dict)
+
+    def v2_antisymmetric_vec(self,ts,E1=None):
+        """ v2_antisymmetric evaluated for a NumPy array of times in one shot """
+        ts = np.asarray(ts)
+        if E1 is None:
+            E1 = np.exp(-self.kappa * ts)
+        return _v2_antisymmetric_core(ts, E1, self.theta_under, self.kappa, self.ss_under)
 
 
 
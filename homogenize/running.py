@@ -1,3 +1,7 @@
+import math
+
+import numpy as np
+
 
 class RunningStats:
 
@@ -24,6 +28,29 @@ class RunningStats:
             self.old_m = self.new_m
             self.old_s = self.new_s
 
+    def push_array(self, xs):
+        """ Merge a whole batch of samples in one pass using Chan's parallel
+            variance combine, equivalent to pushing them one at a time.
+        """
+        n2 = len(xs)
+        if n2 == 0:
+            return
+        xs = np.asarray(xs, dtype=float)
+        m2 = float(xs.mean())
+        s2 = float(((xs - m2) ** 2).sum())
+        if self.n == 0:
+            self.n = n2
+            self.old_m = self.new_m = m2
+            self.old_s = self.new_s = s2
+        else:
+            n1 = self.n
+            self.n = n1 + n2
+            delta = m2 - self.new_m
+            self.new_m = self.new_m + delta * n2 / self.n
+            self.new_s = self.new_s + s2 + delta * delta * n1 * n2 / self.n
+            self.old_m = self.new_m
+            self.old_s = self.new_s
+
     def mean(self):
         return self.new_m if self.n else 0.0
 
@@ -18,36 +18,54 @@ class SlowSimulator(RegimeSwitchingModel):
         self.s         = s
         self.integrals = [ RunningStats() for t in ts]
         self.exp_int   = [ RunningStats() for t in ts]
-        self.survival  = [ 1 for _ in ts ]
+        self.survival  = np.ones(len(ts))
+        self.rng       = np.random.default_rng()
 
     def simulate(self,num):
         dts = np.diff([0] + self.ts)
-        for _ in range(num):
-            intx = 0
-            xt = self.x
-            st = self.s
-            for k, t,dt in zip(range(len(self.ts)), self.ts, dts):
-                 xt_prev = xt
-                 xt   = xt + self.kappa*(self.thetas[st]-xt)*dt + self.sigmas[st]*np.random.randn()*math.sqrt(dt)
-                 intx = intx + dt*(xt_prev+xt)/2
-                 self.integrals[k].push(intx)
-                 self.exp_int[k].push(math.exp(-intx))
-                 if np.random.rand()<dt*self.lmbd:
-                     st = 1-st
-        self.survival  = [ math.exp(-rs.mean() + 0.5 * rs.variance()) for rs in self.integrals]
-        self.survival1 = [ rs.mean() for rs in self.exp_int ]
-        self.survival_std = [ math.sqrt( rs.variance() ) for rs in self.exp_int ]
+        sqrt_dts     = np.sqrt(dts)
+        switch_probs = dts*self.lmbd
+        kappa = self.kappa
+        thetas_arr = np.asarray(self.thetas, dtype=float)
+        sigmas_arr = np.asarray(self.sigmas, dtype=float)
+        Z = self.rng.standard_normal((len(self.ts), num))
+        U = self.rng.random((len(self.ts), num))
+        xt   = np.full(num, self.x, dtype=float)
+        st   = np.full(num, self.s, dtype=np.int8)
+        intx = np.zeros(num)
+        for k, dt in enumerate(dts):
+            xt_prev = xt
+            xt   = xt + kappa*(thetas_arr[st]-xt)*dt + sigmas_arr[st]*Z[k]*sqrt_dts[k]
+            intx = intx + dt*(xt_prev+xt)/2
+            self.integrals[k].push_array(intx)
+            self.exp_int[k].push_array(np.exp(-intx))
+            flip_mask = U[k] < switch_probs[k]
+            np.bitwise_xor(st, flip_mask.view(np.int8), out=st)
+        means     = np.empty(len(self.ts))
+        variances = np.empty(len(self.ts))
+        exp_means = np.empty(len(self.ts))
+        exp_vars  = np.empty(len(self.ts))
+        for k in range(len(self.ts)):
+            means[k]     = self.integrals[k].mean()
+            variances[k] = self.integrals[k].variance()
+            exp_means[k] = self.exp_int[k].mean()
+            exp_vars[k]  = self.exp_int[k].variance()
+        self.survival     = np.exp(-means + 0.5 * variances)
+        self.survival1    = exp_means
+        self.survival_std = np.sqrt(exp_vars)
 
     def check(self, batch_size):
         """ Simulate a plot """
-        dumb   = [ math.exp(-self.theta_bar*t) for t in self.ts ]
-        us     = [ self.u(t,self.x,self.s) for t in self.ts ]
-        u0s    = [ self.u0(t, self.x) for t in self.ts]
-        u0_checks = [self.u0_check(t, self.x) for t in self.ts]
-        series = [ self.series(t,self.x,self.s) for t in self.ts ]
-        consecutive = list()
-        for k in range(6):
-            consecutive.append( [ sum(sr[:k+1]) for sr in series ] )
+        ts_arr = np.asarray(self.ts)
+        dumb   = np.exp(-self.theta_bar*ts_arr)
+        u0_checks = self.u0_check(ts_arr, self.x)
+        series = self.series_vec(ts_arr, self.x, self.s)  # (5, n)
+        us     = series.sum(axis=0)
+        u0s_arr = series[0]
+        consecutive = np.cumsum(series, axis=0)
+        u0_minus_check = 10000 * (u0s_arr - u0_checks)
+        u0_minus_dumb  = 10000 * (u0s_arr - dumb)
+        u_minus_dumb   = 10000 * (us - dumb)
 
         fig, axs = plt.subplots(nrows=2,ncols=2)
         fig.suptitle( self.as_latex() )
@@ -61,23 +79,24 @@ class SlowSimulator(RegimeSwitchingModel):
             axs[0][0].figure
 
             axs[0][1].clear()
-            axs[0][1].plot(self.ts, [ 10000 * (s1 - s2) for s1, s2 in zip( u0s,  self.survival)])
+            axs[0][1].plot(self.ts, 10000 * (u0s_arr - self.survival))
             how_many = 3  # 1..4
             for k in range(1,how_many+1): #
-                axs[0][1].plot(self.ts, [ 10000 * (s1 - s2) for s1, s2 in zip( consecutive[k], self.survival)])
+                axs[0][1].plot(self.ts, 10000 * (consecutive[k] - self.survival))
             axs[0][1].set_xlabel('Discrepancy versus simulation')
             axs[0][1].legend(['u0 - sim']+['Approx '+str(k)+' - sim' for k in range(1,5)][:how_many] )
             axs[0][1].set_ylabel('bps')
-            axs[0][1].plot(self.ts, [ 10000*2*sd/math.sqrt(batch_size*(batch_no+1)) for sd in self.survival_std], 'k-')
-            axs[0][1].plot(self.ts, [-10000*2*sd/math.sqrt(batch_size*(batch_no+1)) for sd in self.survival_std], 'k-')
+            envelope = 10000*2*self.survival_std/math.sqrt(batch_size*(batch_no+1))
+            axs[0][1].plot(self.ts, envelope, 'k-')
+            axs[0][1].plot(self.ts, -envelope, 'k-')
             axs[0][1].set_title('Two standard deviation envelope')
             axs[0][1].grid()
             axs[0][1].figure
 
             axs[1][0].clear()
-            axs[1][0].plot(self.ts, [10000 * (u1 - u2) for u1, u2 in zip(u0s, u0_checks)])
-            axs[1][0].plot(self.ts, [10000 * (u1 - u2) for u1, u2 in zip(u0s, dumb)])
-            axs[1][0].plot(self.ts, [10000 * (u1 - u2) for u1, u2 in zip(us, dumb)])
+            axs[1][0].plot(self.ts, u0_minus_check)
+            axs[1][0].plot(self.ts, u0_minus_dumb)
+            axs[1][0].plot(self.ts, u_minus_dumb)
             axs[1][0].grid()
             axs[1][0].set_xlabel('Adjustments')
             axs[1][0].legend(['u0 - u0_check','u0 - dumb','u - dumb'])
@@ -0,0 +1,12 @@
+import numpy as np
+from homogenize.model import RegimeSwitchingModel
+
+
+def test_numpy_typed_parameters():
+    # Constructing from numpy scalars/arrays must not break the specialized v2_symmetric
+    plain = RegimeSwitchingModel(kappa=2.0, thetas=[0.15, 0.02], sigmas=[0.2355, 0.0742], lmbd=1.7)
+    typed = RegimeSwitchingModel(kappa=np.float64(2.0), thetas=np.array([0.15, 0.02]),
+                                 sigmas=np.array([0.2355, 0.0742]), lmbd=np.float64(1.7))
+    for t in [0.01, 0.5, 1.0, 3.0]:
+        assert abs(typed.v2_symmetric(t) - plain.v2_symmetric(t)) < 1e-15
+        assert abs(typed.u(t, 0.11, 1) - plain.u(t, 0.11, 1)) < 1e-15
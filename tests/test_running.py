@@ -0,0 +1,14 @@
+import numpy as np
+from homogenize.running import RunningStats
+
+
+def test_push_array_matches_push():
+    rs_single = RunningStats()
+    rs_batch = RunningStats()
+    xs = np.random.RandomState(1).randn(1000)
+    for x in xs:
+        rs_single.push(x)
+    rs_batch.push_array(xs[:300])
+    rs_batch.push_array(xs[300:])
+    assert abs(rs_single.mean() - rs_batch.mean()) < 1e-12
+    assert abs(rs_single.variance() - rs_batch.variance()) < 1e-12